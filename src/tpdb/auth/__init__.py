@@ -1,7 +1,6 @@
 """Plex authentication package."""
 
 from tpdb.auth.config import PlexConfigManager, PlexCredentials
-from tpdb.auth.plex_auth import PlexAuthenticator, ConnectionResult
 from tpdb.auth.validators import validate_and_normalize_url, validate_token
 
 __all__ = [
@@ -12,3 +11,12 @@ __all__ = [
     "validate_and_normalize_url",
     "validate_token",
 ]
+
+
+def __getattr__(name):
+    # Load plexapi only when the connection classes are used
+    if name in ("PlexAuthenticator", "ConnectionResult"):
+        from tpdb.auth import plex_auth
+
+        return getattr(plex_auth, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,13 +8,6 @@ import sys
 import typer
 from rich.console import Console
 
-from tpdb.auth import (
-    PlexAuthenticator,
-    PlexConfigManager,
-    PlexCredentials,
-    validate_and_normalize_url,
-    validate_token,
-)
 from tpdb.ui import PlexAuthUI
 
 # Initialize Rich console
@@ -35,6 +28,15 @@ def login(
     ),
 ):
     """Interactive Plex authentication setup."""
+    # Import here so commands that never talk to Plex skip loading plexapi
+    from tpdb.auth import (
+        PlexAuthenticator,
+        PlexConfigManager,
+        PlexCredentials,
+        validate_and_normalize_url,
+        validate_token,
+    )
+
     ui = PlexAuthUI(console)
     auth = PlexAuthenticator(timeout=30)
     config_manager = PlexConfigManager()
@@ -153,6 +155,17 @@ def main_callback(
     download_url: str | None = typer.Option(
         None, "-d", "--download", help="Download a poster from a URL"
     ),
+    refresh_libraries: bool = typer.Option(
+        False,
+        "--refresh-libraries",
+        help="Reload the library list from Plex instead of the local cache",
+    ),
+    yes: bool = typer.Option(
+        False,
+        "-y",
+        "--yes",
+        help="Accept strong matches and process folders without prompting, keeping existing posters unless --all is set",
+    ),
 ):
     """Process posters for Plex libraries."""
     # If a subcommand was invoked, don't run the main logic
@@ -161,24 +174,31 @@ def main_callback(
 
     # Import here to avoid circular imports and to delay loading
     import collections
+    import itertools
     import os
+    from concurrent.futures import ThreadPoolExecutor
 
     from rapidfuzz import fuzz, process, utils
 
+    from tpdb.auth.config import PlexConfigManager, PlexCredentials
+    from tpdb.library_cache import LibraryCache
     from tpdb.main import (
         POSTER_DIR,
         LibraryData,
         Options,
         Posters,
+        batch_sync_movie_folders,
         check_file,
-        copy_posters,
+        confirm,
         download_poster,
         find_posters,
+        has_file,
+        link_posters,
         movie_poster,
         organize_movie_folder,
         organize_show_folder,
+        plan_poster_links,
         process_zip_file,
-        sync_movie_folder,
     )
 
     # Handle download (if specified, download first but continue processing)
@@ -210,40 +230,70 @@ def main_callback(
         plex_url = credentials.url
         plex_token = credentials.token
 
-    # Connect to Plex server with validation
-    auth = PlexAuthenticator(timeout=30)
-    ui = PlexAuthUI(console)
-
-    with ui.show_connecting_status():
-        result = auth.connect(plex_url, plex_token)
-
-    if not result.success:
-        ui.show_error(f"Connection failed: {result.error_message}")
+    # Reuse the library list from a recent run when possible
+    library_cache = LibraryCache()
+    cached_libraries = None if refresh_libraries else library_cache.load(plex_url)
+    if cached_libraries is not None:
+        all_libraries = [
+            LibraryData(lib["title"], lib["type"], lib["locations"])
+            for lib in cached_libraries
+        ]
         console.print(
-            "\n[bold red]✗[/bold red] Failed to connect to Plex server. "
-            "Run [bold]tpdb login[/bold] to reconfigure."
+            "[dim]Using cached library list "
+            "(run with --refresh-libraries to reload from Plex)[/dim]\n"
         )
-        raise typer.Exit(code=1)
+    else:
+        # plexapi is only loaded when the library list has to come from Plex
+        from tpdb.auth.plex_auth import PlexAuthenticator
 
-    ui.show_info(f"Connected to {result.server_info['name']}\n")
-    plex = result.server
+        # Connect to Plex server with validation
+        auth = PlexAuthenticator(timeout=30)
+        ui = PlexAuthUI(console)
 
-    all_libraries = []
-    for library in plex.library.sections():
-        if library.type not in ["artist", "photo"] and library.locations:
-            all_libraries.append(
-                LibraryData(library.title, library.type, library.locations)
+        with ui.show_connecting_status():
+            result = auth.connect(plex_url, plex_token)
+
+        if not result.success:
+            ui.show_error(f"Connection failed: {result.error_message}")
+            console.print(
+                "\n[bold red]✗[/bold red] Failed to connect to Plex server. "
+                "Run [bold]tpdb login[/bold] to reconfigure."
             )
+            raise typer.Exit(code=1)
+
+        ui.show_info(f"Connected to {result.server_info['name']}\n")
+        plex = result.server
+
+        all_libraries = []
+        for library in plex.library.sections():
+            if library.type not in ["artist", "photo"] and library.locations:
+                all_libraries.append(
+                    LibraryData(library.title, library.type, library.locations)
+                )
+        try:
+            library_cache.save(
+                plex_url,
+                [
+                    {"title": lib.title, "type": lib.type, "locations": lib.locations}
+                    for lib in all_libraries
+                ],
+            )
+        except IOError as e:
+            ui.show_warning(f"Could not cache library list: {e}")
 
     # Set library names
     if not libraries:
         libraries = [lib.title for lib in all_libraries]
+    libraries_by_title = {lib.title: lib for lib in reversed(all_libraries)}
+
+    # Poster root candidates are the same for every library, so list them once
+    poster_dir_names = os.listdir(POSTER_DIR)
+    # Media folder names by library location, for locations shared by libraries
+    media_listings: dict[str, list[str]] = {}
 
     # Process each library
     for library_name in libraries:
-        selected_library = next(
-            (lib for lib in all_libraries if lib.title == library_name), None
-        )
+        selected_library = libraries_by_title.get(library_name)
         if not selected_library:
             console.print(f"[bold red]Library '{library_name}' not found.[/bold red]")
             continue
@@ -264,6 +314,7 @@ def main_callback(
         opts_obj.unlinked = unlinked
         opts_obj.action = action
         opts_obj.filter = filter_str
+        opts_obj.yes = yes
 
         main_module.opts = opts_obj
         main_module.poster_data = poster_data
@@ -271,14 +322,30 @@ def main_callback(
         if selected_library.type in ["movie", "show"]:
             # Get all media folders in the library
             for path in selected_library.locations:
-                for name in os.listdir(path):
+                if path not in media_listings:
+                    media_listings[path] = os.listdir(path)
+                for name in media_listings[path]:
                     poster_data.media_folder_names[name].append(path)
+            poster_data.refresh_media_names()
+            if not poster_data.media_names:
+                console.print(
+                    "[yellow]No media folders found in library "
+                    f"{selected_library.title}, posters will not be matched[/yellow]"
+                )
 
             # Get poster root directories for the library
+            root_matches = process.extract(
+                selected_library.title,
+                poster_dir_names,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=70,
+                limit=None,
+            )
+            # Keep directory listing order rather than score order
             poster_root_dirs = [
                 os.path.join(POSTER_DIR, path)
-                for path in os.listdir(POSTER_DIR)
-                if fuzz.partial_ratio(selected_library.title, path) > 70
+                for path, score, _ in sorted(root_matches, key=lambda m: m[2])
+                if score > 70
             ]
             find_posters(poster_root_dirs)
 
@@ -306,70 +373,89 @@ def main_callback(
             match selected_library.type:
                 case "movie":
                     if unlinked:
-                        movie_poster_folders = []
-                        for folder in poster_data.poster_folders:
-                            movie_poster_folders.extend(
-                                [
-                                    os.path.join(folder, name)
-                                    for name in os.listdir(folder)
-                                ]
-                            )
-                        unlinked_folders = set()
-                        for movie in movie_poster_folders:
-                            poster_exists = False
-                            if os.path.isfile(movie):
-                                unlinked_folders.add(os.path.dirname(movie))
-                                continue
-                            for path in os.listdir(movie):
-                                if os.path.isfile(os.path.join(movie, path)):
-                                    poster_exists = True
-                            if (
-                                poster_exists
-                                and not any(
-                                    m in os.path.basename(movie)
-                                    for m in [
-                                        "Collection",
-                                        *poster_data.media_folder_names.keys(),
-                                    ]
-                                )
-                                and "Custom" not in movie
-                            ):
-                                unlinked_folders.add(movie)
-                        if unlinked_folders and typer.confirm(
-                            f"{len(unlinked_folders)} unlinked folders found. Start processing them?"
+                        # Reading every poster folder can take a while on network shares
+                        with console.status(
+                            "[bold cyan]Scanning poster folders for unlinked posters..."
+                        ):
+                            movie_poster_entries = []
+                            for folder in poster_data.poster_folders:
+                                with os.scandir(folder) as it:
+                                    movie_poster_entries.extend(it)
+                            unlinked_folders = set()
+                            # A folder is linked if its name contains a media name;
+                            # exact names, the common case, are a set lookup
+                            media_name_set = set(poster_data.media_names)
+                            link_names = ("Collection", *poster_data.media_names)
+                            for entry in movie_poster_entries:
+                                movie = entry.path
+                                if entry.is_file():
+                                    unlinked_folders.add(os.path.dirname(movie))
+                                    continue
+                                # Name checks first, so linked folders are never read
+                                if (
+                                    entry.name not in media_name_set
+                                    and "Custom" not in movie
+                                    and not any(m in entry.name for m in link_names)
+                                    and has_file(movie)
+                                ):
+                                    unlinked_folders.add(movie)
+                        if unlinked_folders and confirm(
+                            f"{len(unlinked_folders)} unlinked folders found. Start processing them?",
+                            yes_answer=True,
                         ):
-                            for folder in unlinked_folders:
-                                sync_movie_folder(folder)
+                            batch_sync_movie_folders(unlinked_folders)
                     elif action == "new":
                         movie_poster()
                         process_zip_file(selected_library)
                     elif action == "sync":
                         for folder in poster_data.poster_folders:
-                            poster_exists = any(
-                                os.path.isfile(os.path.join(folder, x))
-                                for x in os.listdir(folder)
-                            )
-                            if poster_exists and (
+                            if has_file(folder) and (
                                 replace_all
-                                or typer.confirm(f'Process folder "{folder}"?')
+                                or confirm(
+                                    f'Process folder "{folder}"?', yes_answer=True
+                                )
                             ):
                                 organize_movie_folder(folder)
                 case "show":
                     if action == "new":
                         process_zip_file(selected_library)
                     elif action == "sync":
-                        unorganized_poster_folders = [
-                            folder
-                            for folder in poster_data.poster_folders
-                            if not check_file(folder, "poster")
-                        ]
-                        for folder in unorganized_poster_folders:
-                            organize_show_folder(folder)
+                        # Show folders are organized without prompts, so the
+                        # folders can be checked and renamed concurrently
+                        with ThreadPoolExecutor() as executor:
+                            organized = list(
+                                executor.map(
+                                    check_file,
+                                    poster_data.poster_folders,
+                                    itertools.repeat("poster"),
+                                )
+                            )
+                            unorganized_poster_folders = [
+                                folder
+                                for folder, done in zip(
+                                    poster_data.poster_folders, organized
+                                )
+                                if not done
+                            ]
+                            list(
+                                executor.map(
+                                    organize_show_folder, unorganized_poster_folders
+                                )
+                            )
 
             # Move posters to media folders
             if copy:
-                for folder in poster_data.poster_folders:
-                    copy_posters(folder)
+                # Ask about every folder first, then link all posters in one pool.
+                # The stem index is shared, so poster folders that map to the
+                # same media folder replace each other's posters in order.
+                target_prefixes = {}
+                link_posters(
+                    [
+                        link
+                        for folder in poster_data.poster_folders
+                        for link in plan_poster_links(folder, target_prefixes)
+                    ]
+                )
         else:
             console.print("[bold yellow]Library type not setup yet[/bold yellow]")
 
@@ -0,0 +1,117 @@
+"""Cache of Plex library listings between runs."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+
+class LibraryCache:
+    """Stores the library list of each Plex server in a JSON file.
+
+    Each server URL maps to the time the list was saved and the libraries
+    themselves, as dictionaries with `title`, `type` and `locations` keys.
+    Entries older than `ttl` seconds are treated as missing.
+
+    Attributes:
+        cache_path: Path to the cache file
+        ttl: Maximum age of a cached entry in seconds
+    """
+
+    DEFAULT_CACHE_DIR = Path.home() / ".cache" / "tpdb"
+    DEFAULT_CACHE_FILE = "libraries.json"
+    DEFAULT_TTL = 3600
+
+    def __init__(self, cache_path: Path | None = None, ttl: float = DEFAULT_TTL):
+        """Initialize the library cache.
+
+        Args:
+            cache_path: Custom path to the cache file. If None, uses default location.
+            ttl: Maximum age of a cached entry in seconds
+        """
+        self.cache_path = cache_path or (
+            self.DEFAULT_CACHE_DIR / self.DEFAULT_CACHE_FILE
+        )
+        self.ttl = ttl
+
+    def _read(self) -> dict:
+        """Read the whole cache file.
+
+        Returns:
+            The cached entries keyed by server URL, or an empty dict if the
+            file is missing or unreadable.
+        """
+        try:
+            with open(self.cache_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _valid_library(library) -> bool:
+        """Check that a cached library has the fields the CLI reads.
+
+        Args:
+            library: A single cached library entry
+
+        Returns:
+            True if it is a dict with string `title` and `type` and a list of
+            string `locations`.
+        """
+        return (
+            isinstance(library, dict)
+            and isinstance(library.get("title"), str)
+            and isinstance(library.get("type"), str)
+            and isinstance(library.get("locations"), list)
+            and all(isinstance(loc, str) for loc in library["locations"])
+        )
+
+    def load(self, server_url: str) -> list[dict] | None:
+        """Load the cached libraries for a server.
+
+        Args:
+            server_url: Plex server base URL the libraries belong to
+
+        Returns:
+            The cached library dictionaries, or None if there is no fresh and
+            well-formed entry.
+        """
+        entry = self._read().get(server_url)
+        if not isinstance(entry, dict):
+            return None
+        saved_at = entry.get("saved_at")
+        libraries = entry.get("libraries")
+        if not isinstance(saved_at, (int, float)) or not isinstance(libraries, list):
+            return None
+        if time.time() - saved_at >= self.ttl:
+            return None
+        if not all(self._valid_library(library) for library in libraries):
+            return None
+        return libraries
+
+    def save(self, server_url: str, libraries: list[dict]) -> None:
+        """Save the libraries for a server.
+
+        Entries for other servers are kept. The file is written to a temporary
+        path first and then moved into place, so a partial write never
+        replaces a valid cache.
+
+        Args:
+            server_url: Plex server base URL the libraries belong to
+            libraries: Library dictionaries with `title`, `type` and `locations`
+
+        Raises:
+            IOError: If the cache file cannot be written
+        """
+        data = self._read()
+        data[server_url] = {"saved_at": time.time(), "libraries": libraries}
+
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            raise IOError(f"Failed to save cache to {self.cache_path}: {e}") from e
@@ -2,26 +2,97 @@
 from __future__ import print_function, unicode_literals
 
 import collections
+import errno
+import itertools
 import os
 import re
 import shutil
 import zipfile
-from xmlrpc.client import Boolean
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 import pyrfc6266
 import requests
 import typer
 from rapidfuzz import fuzz, process, utils
 from rich.console import Console
+from rich.markup import escape
 from rich.progress import Progress
+from rich.table import Table
 
-from tpdb.matcher import find_best_media_match
+from tpdb.matcher import find_best_media_match, normalize_name, sort_tokens
 
 # Initialize Rich console
 console = Console()
 
+# Precompiled patterns for per-file name parsing
+_SEASON_RE = re.compile(r"Season (\d+)")
+# Season posters in show packs end with the season, e.g. "Show - Season 1"
+_SEASON_SUFFIX_RE = re.compile(r"\bSeason \d+$")
+_SET_BY_RE = re.compile(r"\b.+ set by (?:\S+)")
+
+# Poster file types kept when extracting zip files
+_IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
+# Shared HTTP session so repeated downloads reuse the same connection
+_http_session = requests.Session()
+_http_session.headers.update(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
+    }
+)
+# Seconds to wait for the server to connect or send more data
+_DOWNLOAD_TIMEOUT = 30
+# Lowest match score accepted without asking in --yes mode
+_AUTO_ACCEPT_SCORE = 90
+
 
 # Helper functions for user prompts
+def confirm(
+    message: str, default: bool = False, yes_answer: bool | None = None
+) -> bool:
+    """Ask a yes/no question, or answer it without asking in `--yes` mode.
+
+    In `--yes` mode the question gets `yes_answer` if given, and its default
+    otherwise, so questions that default to no are only answered yes where a
+    caller has marked that as safe.
+
+    Args:
+        message: The question to ask
+        default: Answer used when the user just presses enter
+        yes_answer: Answer used in `--yes` mode, if different from `default`
+
+    Returns:
+        bool: True if the answer is yes, False otherwise
+    """
+    if opts.yes:
+        answer = default if yes_answer is None else yes_answer
+        console.print(
+            f"{escape(message)} [dim]{'yes' if answer else 'no'} (--yes)[/dim]"
+        )
+        return answer
+    return typer.confirm(message, default=default)
+
+
+def _auto_accept(match_score: int | float) -> bool:
+    """Answer a match prompt in `--yes` mode from the match score.
+
+    Args:
+        match_score: The fuzzy match score (0-100)
+
+    Returns:
+        bool: True if the score is high enough to accept the match unasked
+    """
+    if match_score >= _AUTO_ACCEPT_SCORE:
+        console.print("[dim]Accepted match (--yes)[/dim]")
+        return True
+    console.print(
+        f"[yellow]Skipped: score below {_AUTO_ACCEPT_SCORE}, "
+        "run without --yes to review this match[/yellow]"
+    )
+    return False
+
+
 def prompt_match_confirmation(
     source_name: str,
     match_name: str,
@@ -54,7 +125,9 @@ def prompt_match_confirmation(
     console.print(f"  Score:   [{score_color}]{match_score}/100[/{score_color}]")
     console.print()
 
-    return typer.confirm("Proceed with this match?", default=True)
+    if opts.yes:
+        return _auto_accept(match_score)
+    return confirm("Proceed with this match?", default=True)
 
 
 def prompt_collection_organization(
@@ -80,14 +153,14 @@ def prompt_collection_organization(
         console.print(
             "[dim]This appears to be a collection/set with multiple movies.[/dim]"
         )
-        return typer.confirm("Unzip and organize movies individually?", default=True)
+        return confirm("Unzip and organize movies individually?", default=True)
     else:
         console.print("  Match:   [red]No match found[/red]")
         console.print()
         console.print(
             "[dim]This appears to be a collection/set with multiple movies.[/dim]"
         )
-        return typer.confirm("Unzip and organize movies individually?", default=True)
+        return confirm("Unzip and organize movies individually?", default=True)
 
 
 def prompt_poster_organization(
@@ -121,10 +194,102 @@ def prompt_poster_organization(
     console.print()
     console.print("[dim]Options: (y) use match, (f) force rename, (n) skip[/dim]")
 
+    if opts.yes:
+        return "y" if _auto_accept(match_score) else "n"
     return typer.prompt("Choose", default="y").lower()
 
 
+def prompt_file_selection(title: str, file_names: list[str]) -> list[int]:
+    """Display a numbered table of files and ask once which ones to process.
+
+    Accepts comma-separated numbers and ranges (e.g. ``1,3-5``), ``all``, or
+    an empty answer to select nothing. Invalid input is asked again. In
+    `--yes` mode nothing is selected, the same as the empty default answer.
+
+    Args:
+        title: Table title
+        file_names: File names to list, in display order
+
+    Returns:
+        list[int]: Sorted zero-based indices of the selected files
+    """
+    table = Table(title=title)
+    table.add_column("#", justify="right", style="cyan")
+    table.add_column("File")
+    for number, file_name in enumerate(file_names, start=1):
+        table.add_row(str(number), file_name)
+    console.print()
+    console.print(table)
+
+    if opts.yes:
+        console.print("[dim]Selected no files (--yes)[/dim]")
+        return []
+    while True:
+        answer = typer.prompt(
+            "Select files (e.g. 1,3-5, 'all'), blank to skip",
+            default="",
+            show_default=False,
+        ).strip()
+        if not answer:
+            return []
+        if answer.lower() == "all":
+            return list(range(len(file_names)))
+        selected = set()
+        try:
+            for part in answer.split(","):
+                start, _, end = part.strip().partition("-")
+                first, last = int(start), int(end or start)
+                if not 1 <= first <= last <= len(file_names):
+                    raise ValueError(part)
+                selected.update(range(first - 1, last))
+        except ValueError:
+            console.print(f"[red]Invalid selection: {answer}[/red]")
+            continue
+        return sorted(selected)
+
+
+def match_media_folder(
+    file_name,
+    media_names,
+    media_keys,
+    score_cutoff=None,
+    processor=utils.default_process,
+):
+    """Matches a poster file name to the closest media folder name.
+
+    Gives the same result as `process.extractOne` with the `token_sort_ratio`
+    scorer and the given processor, but compares against media keys that were
+    processed and token-sorted once by the caller.
+
+    Args:
+        file_name (str): The poster file name to match.
+        media_names (list): The media folder names.
+        media_keys (list): The processed, token-sorted form of each media
+            folder name, in the same order as `media_names`.
+        score_cutoff (float | None): Minimum score for a match.
+        processor (Callable | None): Processor applied to `file_name` before
+            its tokens are sorted. Must match the one used for `media_keys`.
+
+    Returns:
+        tuple | None: The matched media name and its score, or None.
+    """
+    if not media_keys:
+        return None
+    if processor is not None:
+        file_name = processor(file_name)
+    result = process.extractOne(
+        sort_tokens(file_name),
+        media_keys,
+        scorer=fuzz.ratio,
+        score_cutoff=score_cutoff,
+    )
+    if result is None:
+        return None
+    return media_names[result[2]], result[1]
+
+
 # Data classes
+@dataclass(slots=True)
 class LibraryData:
     """A data class to hold information about a Plex library.
 
@@ -134,10 +299,9 @@ class LibraryData:
         locations (list): A list of file paths for the library's content.
     """
 
-    def __init__(self, title=None, type=None, locations=None):
-        self.title = title
-        self.type = type
-        self.locations = locations
+    title: str | None = None
+    type: str | None = None
+    locations: list[str] | None = None
 
 
 class Posters:
@@ -149,8 +313,25 @@ class Posters:
         poster_zip_files (dict): A dictionary mapping zip file names to their paths.
         media_folder_names (collections.defaultdict): A dictionary mapping media folder names
             to a list of their root paths.
+        media_names (list): Cached list of the `media_folder_names` keys.
+        media_sort_keys (list): Token-sorted form of each media name.
+        media_processed_keys (list): Processed, token-sorted form of each media
+            name, for matching with `utils.default_process`.
+        media_normalized_names (list): `normalize_name` form of each media name,
+            for matching poster zip names.
     """
 
+    __slots__ = (
+        "poster_folders",
+        "poster_files",
+        "poster_zip_files",
+        "media_folder_names",
+        "media_names",
+        "media_sort_keys",
+        "media_processed_keys",
+        "media_normalized_names",
+    )
+
     def __init__(
         self,
         poster_folders=None,
@@ -166,6 +347,19 @@ class Posters:
             if media_folder_names is not None
             else collections.defaultdict(list)
         )
+        self.refresh_media_names()
+
+    def refresh_media_names(self):
+        """Rebuilds the cached media name lists from `media_folder_names`.
+
+        Must be called after `media_folder_names` is populated or changed.
+        """
+        self.media_names = list(self.media_folder_names.keys())
+        self.media_sort_keys = [sort_tokens(name) for name in self.media_names]
+        self.media_processed_keys = [
+            sort_tokens(utils.default_process(name)) for name in self.media_names
+        ]
+        self.media_normalized_names = [normalize_name(n) for n in self.media_names]
 
 
 class Options:
@@ -181,6 +375,7 @@ class Options:
         unlinked (bool): Find and process unlinked posters.
         action (str): Action to perform ('new' or 'sync').
         filter (str | None): String filter for source poster folders.
+        yes (bool): Answer yes to every confirmation prompt.
     """
 
     def __init__(self):
@@ -190,6 +385,7 @@ class Options:
         self.unlinked: bool = False
         self.action: str = "new"
         self.filter: str | None = None
+        self.yes: bool = False
 
 
 # Global static variables
@@ -202,35 +398,6 @@ POSTER_DIR = "/data/Posters"
 poster_data: Posters = Posters()  # type: ignore[reportUnboundVariable]
 opts: Options = Options()  # type: ignore[reportUnboundVariable]
 
-################################# Start Plex Config #######################################
-
-
-def update_config(config_path):
-    """Updates the PlexAPI config file with the provided URL and token.
-
-    Args:
-        config_path (str): The path to the PlexAPI config file.
-
-    Returns:
-        bool: True if the file was updated, False otherwise.
-    """
-    updated = False
-    with open(config_path, "r") as configfile:
-        lines = configfile.readlines()
-
-    with open(config_path, "w") as configfile:
-        for line in lines:
-            if line.startswith("server_baseurl"):
-                configfile.write(f"server_baseurl = {PLEX_URL}\n")
-                updated = True
-            elif line.startswith("server_token"):
-                configfile.write(f"server_token = {PLEX_TOKEN}\n")
-                updated = True
-            else:
-                configfile.write(line)
-
-    return updated
-
 
 def download_poster(url):
     """Downloads a poster from a given URL.
@@ -244,9 +411,6 @@ def download_poster(url):
     """
     from rich.prompt import Prompt
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-    }
     custom_filename = None
     filename = None
     if "theposterdb.com/set" in url:
@@ -261,49 +425,75 @@ def download_poster(url):
         download_url = url
         custom_filename = Prompt.ask("Enter movie name for poster file (no ext)")
     if download_url:
-        response = requests.get(download_url, headers=headers, stream=True)
+        response = _http_session.get(
+            download_url, stream=True, timeout=_DOWNLOAD_TIMEOUT
+        )
     else:
         console.print("[bold red]Invalid URL[/bold red]")
         return
-    if response.status_code == 200:
-        filename = response.headers.get("content-disposition", None)
-        if not custom_filename and filename:
-            filename = pyrfc6266.parse_filename(filename)
-        elif custom_filename and filename:
-            filename = "".join(
-                [
-                    custom_filename,
-                    os.path.splitext(pyrfc6266.parse_filename(filename))[1],
-                ]
-            )
-        elif custom_filename:
-            filename = "".join(
-                [custom_filename, os.path.splitext(os.path.basename(url))[1]]
-            )
-        else:
-            console.print(
-                "[bold red]Could not find a filename, aborting download[/bold red]"
-            )
-            return
-        console.print("[bold cyan]Select folder to save poster file[/bold cyan]")
-        for i, dir in enumerate(os.listdir(POSTER_DIR), start=1):
-            console.print(f"{i}: {dir}")
-        dir_index = Prompt.ask("Enter folder number")
-        save_dir = os.path.join(POSTER_DIR, os.listdir(POSTER_DIR)[int(dir_index) - 1])
-        total_bytes = int(response.headers.get("content-length", 0)) or None
-
-        with open(os.path.join(save_dir, filename), "wb") as file:
-            with Progress() as progress:
-                task = progress.add_task(
-                    f"[cyan]Downloading {filename}...", total=total_bytes
+    with response:
+        if response.status_code == 200:
+            filename = response.headers.get("content-disposition", None)
+            if not custom_filename and filename:
+                filename = pyrfc6266.parse_filename(filename)
+            elif custom_filename and filename:
+                filename = "".join(
+                    [
+                        custom_filename,
+                        os.path.splitext(pyrfc6266.parse_filename(filename))[1],
+                    ]
                 )
-                for chunk in response.iter_content(chunk_size=4096):
-                    file.write(chunk)
-                    if total_bytes:
-                        progress.update(task, advance=len(chunk))
-        console.print(f"[bold green]File downloaded as '{filename}'[/bold green]")
-    else:
-        console.print("[bold red]Failed to download the file[/bold red]")
+            elif custom_filename:
+                filename = "".join(
+                    [custom_filename, os.path.splitext(os.path.basename(url))[1]]
+                )
+            else:
+                console.print(
+                    "[bold red]Could not find a filename, aborting download[/bold red]"
+                )
+                return
+            console.print("[bold cyan]Select folder to save poster file[/bold cyan]")
+            with os.scandir(POSTER_DIR) as it:
+                poster_dirs = sorted(
+                    (entry for entry in it if entry.is_dir()),
+                    key=lambda entry: entry.name.lower(),
+                )
+            for i, entry in enumerate(poster_dirs, start=1):
+                console.print(f"{i}: {entry.name}")
+            dir_index = Prompt.ask("Enter folder number")
+            save_dir = poster_dirs[int(dir_index) - 1].path
+            total_bytes = int(response.headers.get("content-length", 0)) or None
+
+            with open(os.path.join(save_dir, filename), "wb") as file:
+                with Progress() as progress:
+                    task = progress.add_task(
+                        f"[cyan]Downloading {filename}...", total=total_bytes
+                    )
+                    for chunk in response.iter_content(chunk_size=1 << 16):
+                        file.write(chunk)
+                        if total_bytes:
+                            progress.update(task, advance=len(chunk))
+            console.print(f"[bold green]File downloaded as '{filename}'[/bold green]")
+        else:
+            console.print("[bold red]Failed to download the file[/bold red]")
+
+
+def place_poster(source_file, poster_folder):
+    """Moves a poster file into a folder as its `poster` image.
+
+    The folder is created if needed. An existing folder is reused and only
+    its previous `poster.*` files are replaced, so other files kept next to
+    the poster are left alone.
+
+    Args:
+        source_file (str): The poster file to move.
+        poster_folder (str): The folder the poster belongs in.
+    """
+    os.makedirs(poster_folder, exist_ok=True)
+    poster_name = "poster%s" % os.path.splitext(source_file)[1]
+    # A poster with the same extension is swapped out by the atomic replace
+    delete_file(poster_folder, "poster", keep=poster_name)
+    os.replace(source_file, os.path.join(poster_folder, poster_name))
 
 
 def organize_movie_folder(folder_dir):
@@ -311,52 +501,73 @@ def organize_movie_folder(folder_dir):
 
     Renames poster files and creates a subfolder named after each movie,
     placing the renamed poster inside. Automatically organizes all posters that have an
-    exact or strong fuzzy match to a media folder.
+    exact or strong fuzzy match to a media folder, and offers to force rename
+    posters without a match.
 
     Args:
         folder_dir (str): The path to the folder containing the movie posters.
     """
     global poster_data, opts
-    for file in os.listdir(folder_dir):
+    with os.scandir(folder_dir) as it:
+        files = [entry.name for entry in it if entry.is_file()]
+    # Score every poster up front so the matching runs without prompt stalls
+    matches = [
+        None
+        if opts.force or "Collection" in file
+        else match_media_folder(
+            file,
+            poster_data.media_names,
+            poster_data.media_processed_keys,
+            score_cutoff=60,
+        )
+        for file in files
+    ]
+    for file, matched_media in zip(files, matches):
         source_file = os.path.join(folder_dir, file)
-        collection = False
-        matched_media = []
-        if os.path.isfile(source_file):
-            if "Collection" not in file:
-                matched_media = process.extractOne(
-                    file,
-                    poster_data.media_folder_names.keys(),
-                    scorer=fuzz.token_sort_ratio,
-                    processor=utils.default_process,
-                )
-            else:
-                collection = True
-            user_in = ""
-            if opts.force:
-                user_in = "f"
-            else:
-                if matched_media:
-                    user_in = prompt_poster_organization(
-                        file, matched_media[0], matched_media[1]
-                    )
-                else:
-                    user_in = None
-            # Choosing option 'f' follows the force renaming logic for the movie folder/poster
-            if opts.force or collection or (matched_media and user_in in ["y", "f"]):
-                file_name = (
-                    os.path.splitext(os.path.basename(file))[0]
-                    if (opts.force or user_in == "f" or collection)
-                    else matched_media[0]  # type: ignore[index]
-                )
-                file_extension = os.path.splitext(file)[1]
-                new_folder = os.path.join(folder_dir, file_name)
-                if os.path.isdir(new_folder):
-                    shutil.rmtree(new_folder)
-                os.mkdir(new_folder)
-                destination_file = os.path.join(
-                    new_folder, ("poster%s" % (file_extension))
-                )
-                os.rename(source_file, destination_file)
+        collection = "Collection" in file
+        user_in = ""
+        if opts.force:
+            user_in = "f"
+        elif matched_media:
+            user_in = prompt_poster_organization(
+                file, matched_media[0], matched_media[1]
+            )
+        elif not collection:
+            # No match found - ask if user wants to force rename
+            console.print()
+            console.print(f"[yellow]No match found for:[/yellow] [dim]{file}[/dim]")
+            user_in = "f" if confirm("Force rename anyway?", default=False) else None
+        # Choosing option 'f' follows the force renaming logic for the movie folder/poster
+        if opts.force or collection or user_in in ["y", "f"]:
+            file_stem = os.path.splitext(file)[0]
+            file_name = (
+                file_stem
+                if (opts.force or user_in == "f" or collection)
+                else matched_media[0]  # type: ignore[index]
+            )
+            place_poster(source_file, os.path.join(folder_dir, file_name))
+
+
+def show_poster_name(file_name):
+    """Returns the Plex name for a TV show poster file.
+
+    Args:
+        file_name (str): The poster file name.
+
+    Returns:
+        str: 'SeasonNN' for season posters, 'Season00' for specials and
+            'poster' otherwise, with the original extension. Names containing
+            'Season' without a season number are returned unchanged.
+    """
+    file_extension = os.path.splitext(file_name)[1]
+    if "Season" in file_name:
+        x = _SEASON_RE.search(file_name)
+        if not x:
+            return file_name
+        return f"Season{int(x.group(1)):02d}{file_extension}"
+    elif "Specials" in file_name:
+        return "Season00%s" % file_extension
+    return "poster%s" % file_extension
 
 
 def organize_show_folder(folder_dir):
@@ -370,56 +581,101 @@ def organize_show_folder(folder_dir):
         folder_dir (str): The directory path containing the TV show poster files.
     """
     global poster_data
-    for file in os.listdir(folder_dir):
-        source_file = os.path.join(folder_dir, file)
-        if os.path.isfile(source_file):
-            if "Season" in file:
-                x = re.search(r"\b(?<=Season )\d+", file)
-                if x:
-                    season_number = str(x.group()).zfill(2)
-                    file_extension = os.path.splitext(file)[1]
-                    destination_file = os.path.join(
-                        folder_dir, ("Season%s%s" % (season_number, file_extension))
-                    )
-                    os.rename(source_file, destination_file)
-            elif "Specials" in file:
-                season_number = "00"
-                file_extension = os.path.splitext(file)[1]
-                destination_file = os.path.join(
-                    folder_dir, ("Season%s%s" % (season_number, file_extension))
-                )
-                os.rename(source_file, destination_file)
-            else:
-                file_extension = os.path.splitext(file)[1]
-                destination_file = os.path.join(
-                    folder_dir, ("poster%s" % (file_extension))
-                )
-                os.rename(source_file, destination_file)
+    # Materialize the listing since files are renamed in the same directory
+    with os.scandir(folder_dir) as it:
+        entries = [entry for entry in it if entry.is_file()]
+    for entry in entries:
+        destination_name = show_poster_name(entry.name)
+        # Already organized files keep their name
+        if destination_name != entry.name:
+            os.rename(entry.path, os.path.join(folder_dir, destination_name))
 
 
 def movie_poster():
     """Processes individual movie posters not in a collection folder.
 
-    This function iterates through loose poster files and asks the user if they
-    want to move them into a 'Custom' subfolder for organization. This is
+    This function lists the loose poster files in one table and asks the user
+    which of them to move into a 'Custom' subfolder for organization. This is
     useful for preparing posters for use with Kometa or for manual review.
     """
     global poster_data
-    for poster in poster_data.poster_files:
-        if typer.confirm(
-            f"Move poster file {os.path.basename(poster)} to Custom posters folder?"
-        ):
-            if "Custom" not in poster:
-                source_dir = os.path.dirname(poster)
-                destination_dir = os.path.join(source_dir, "Custom")
-            else:
-                destination_dir = os.path.dirname(poster)
-            if not os.path.isdir(destination_dir):
-                os.mkdir(destination_dir)
-            shutil.move(poster, destination_dir)
-            organize_movie_folder(destination_dir)
+    if not poster_data.poster_files:
+        return
+    selected = prompt_file_selection(
+        "Loose poster files",
+        [os.path.basename(poster) for poster in poster_data.poster_files],
+    )
+    if not selected:
+        console.print("[yellow]Skipped files[/yellow]")
+        return
+
+    # Move every selected poster first, then organize each folder once
+    destination_dirs = {}
+    for index in selected:
+        poster = poster_data.poster_files[index]
+        if "Custom" not in poster:
+            source_dir = os.path.dirname(poster)
+            destination_dir = os.path.join(source_dir, "Custom")
         else:
-            console.print("[yellow]Skipped files[/yellow]")
+            destination_dir = os.path.dirname(poster)
+        if destination_dir not in destination_dirs:
+            os.makedirs(destination_dir, exist_ok=True)
+            destination_dirs[destination_dir] = None
+        destination_file = os.path.join(destination_dir, os.path.basename(poster))
+        if destination_file == poster:
+            continue
+        # Never overwrite a poster already waiting in the Custom folder
+        if os.path.lexists(destination_file):
+            console.print(
+                f"[yellow]Skipped {os.path.basename(poster)}: a file with the "
+                f"same name already exists in {destination_dir}[/yellow]"
+            )
+            continue
+        os.rename(poster, destination_file)
+    for destination_dir in destination_dirs:
+        organize_movie_folder(destination_dir)
+
+
+def _is_zip(path):
+    """Checks for the zip local file header magic without parsing the archive.
+
+    Args:
+        path (str): Path of the file to check.
+
+    Returns:
+        bool: True if the file starts with a zip local file header.
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(4) == b"PK\x03\x04"
+    except OSError:
+        return False
+
+
+def scan_poster_root(root_dir):
+    """Lists one poster root directory and sorts its entries by kind.
+
+    Entry types come from `os.scandir`, and only files with a `.zip` suffix
+    have their first four bytes read to check whether they are zip archives.
+
+    Args:
+        root_dir (str): The poster root directory to scan.
+
+    Returns:
+        tuple: Lists of folder paths, loose poster file paths and zip file names.
+    """
+    folders, files, zip_names = [], [], []
+    with os.scandir(root_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                folders.append(entry.path)
+            elif not entry.is_file():
+                continue
+            elif entry.name.lower().endswith(".zip") and _is_zip(entry.path):
+                zip_names.append(entry.name)
+            else:
+                files.append(entry.path)
+    return folders, files, zip_names
 
 
 def find_posters(poster_root_dirs):
@@ -428,94 +684,195 @@ def find_posters(poster_root_dirs):
     This function scans the provided directories and categorizes the found items
     into three groups: zipped poster packs, folders containing posters, and
     individual poster files. It also renames zip files to a cleaner format.
+    The root directories are scanned concurrently, and the zip renames are
+    applied afterwards.
 
     Args:
         poster_root_dirs (list): A list of directory paths to search for posters.
     """
     global poster_data
-    for path1 in poster_root_dirs:
-        for path2 in os.listdir(path1):
-            file_path: str = os.path.join(path1, path2)
-            if zipfile.is_zipfile(file_path):
-                zip_file_path = file_path
-                x = re.search(r"\b.+ set by (?:\S+)", os.path.splitext(path2)[0])
-                if x:
-                    new_zip_file_name = x.group() + os.path.splitext(path2)[1]
-                else:
-                    new_zip_file_name: str = (
-                        path2.split(".", 1)[0].split("__", 1)[0]
-                        + "."
-                        + path2.split(".", 1)[1]
-                    ).replace("_", " ")
-                # new_zip_file_name = path2.replace('_', ' ')
-                new_zip_file_path = os.path.join(path1, new_zip_file_name)
-                if path2 != new_zip_file_name:
-                    os.rename(zip_file_path, new_zip_file_path)
-                poster_data.poster_zip_files[new_zip_file_name] = new_zip_file_path
-            elif os.path.isdir(file_path):
-                poster_data.poster_folders.append(file_path)
-            elif os.path.isfile(file_path):
-                poster_data.poster_files.append(file_path)
-            else:
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(scan_poster_root, poster_root_dirs))
+    for path1, (folders, files, zip_names) in zip(poster_root_dirs, results):
+        poster_data.poster_folders.extend(folders)
+        poster_data.poster_files.extend(files)
+        for path2 in zip_names:
+            zip_file_path = os.path.join(path1, path2)
+            # Names without underscores or a "set by" credit are already clean
+            if "_" not in path2 and " set by " not in path2:
+                poster_data.poster_zip_files[path2] = zip_file_path
                 continue
+            zip_stem, zip_extension = os.path.splitext(path2)
+            x = _SET_BY_RE.search(zip_stem)
+            if x:
+                new_zip_file_name = x.group() + zip_extension
+            else:
+                new_zip_file_name: str = (
+                    path2.split(".", 1)[0].split("__", 1)[0]
+                    + "."
+                    + path2.split(".", 1)[1]
+                ).replace("_", " ")
+            # new_zip_file_name = path2.replace('_', ' ')
+            new_zip_file_path = os.path.join(path1, new_zip_file_name)
+            if path2 != new_zip_file_name:
+                os.rename(zip_file_path, new_zip_file_path)
+            poster_data.poster_zip_files[new_zip_file_name] = new_zip_file_path
+
 
+def link_poster(orig_file, new_file, replace=False):
+    """Creates a hardlink to a poster file.
 
-def copy_posters(poster_folder):
-    """Copies posters from a poster folder to the corresponding Plex media folders.
+    If a file already exists at the link path, the link is created next to it
+    and moved over it, so the path never goes missing while being replaced.
 
-    Creates hard links from the poster folder to each media folder location.
+    Args:
+        orig_file (str): The poster file to link to.
+        new_file (str): The path of the new link.
+        replace (bool): If True, first remove posters with the same name but
+            another extension.
+
+    Returns:
+        OSError | None: The error raised while linking, or None on success.
+    """
+    try:
+        if replace:
+            target_dir, new_name = os.path.split(new_file)
+            stem = os.path.splitext(new_name)[0]
+            for stale_file in matching_files(target_dir, stem, keep=new_name):
+                os.remove(stale_file)
+        os.link(orig_file, new_file)
+    except FileExistsError:
+        tmp_file = new_file + ".tmp"
+        try:
+            os.link(orig_file, tmp_file)
+            os.replace(tmp_file, new_file)
+        except OSError as e:
+            if os.path.lexists(tmp_file):
+                os.remove(tmp_file)
+            return e
+    except OSError as e:
+        return e
+    return None
+
+
+def plan_poster_links(poster_folder, target_prefixes=None):
+    """Plans the hard links from a poster folder to its Plex media folders.
+
+    All prompts are asked here, but nothing on disk is changed, so stopping
+    at a prompt leaves the media folders as they were. Pass the result to
+    `link_posters`.
 
     Args:
         poster_folder (str): The path to the organized poster folder.
+        target_prefixes (dict | None): File stems in each target folder, kept
+            up to date with the planned links. Share one dict between calls
+            so a folder planned later sees the posters planned before it.
+
+    Returns:
+        list: The planned links as (orig_file, new_file, replace) tuples.
     """
     global poster_data, opts
-    media_folders = poster_data.media_folder_names.get(os.path.basename(poster_folder))
+    # Each planned link is (orig_file, new_file, replace)
+    links = []
+    media_name = os.path.basename(poster_folder)
+    media_folders = poster_data.media_folder_names.get(media_name)
     if media_folders:
-        media_name = os.path.basename(poster_folder)
-        poster_file_names = os.listdir(poster_folder)
-        if opts.all or typer.confirm(
-            f"Hardlink posters from [{poster_folder}] to [{media_folders}]?"
+        # Only files can be hardlinked, so skip any nested folders
+        with os.scandir(poster_folder) as it:
+            poster_file_names = [entry.name for entry in it if entry.is_file()]
+        if opts.all or confirm(
+            f"Hardlink posters from [{poster_folder}] to [{media_folders}]?",
+            yes_answer=True,
         ):
             replace_files = False
+            # File stems in each target folder, scanned once and kept up to date
+            if target_prefixes is None:
+                target_prefixes = {}
             for poster in poster_file_names:
+                orig_file = os.path.join(poster_folder, poster)
+                new_name = poster
+                if "Season00" in poster:
+                    new_name = poster.replace("Season00", "season-specials-poster")
+                elif "Season" in poster:
+                    poster_stem, poster_extension = os.path.splitext(poster)
+                    new_name = f"{poster_stem.lower()}-poster{poster_extension}"
+                new_prefix = os.path.splitext(new_name)[0]
+                orig_stat = None
                 for media_root in media_folders:
-                    orig_file = os.path.join(poster_folder, poster)
-                    new_name = poster
-                    if "Season00" in poster:
-                        new_name = poster.replace("Season00", "season-specials-poster")
-                    elif "Season" in poster:
-                        new_name = (
-                            poster.split(".")[0].lower()
-                            + "-poster"
-                            + "."
-                            + poster.split(".")[1]
+                    target_dir = os.path.join(media_root, media_name)
+                    new_file = os.path.join(target_dir, new_name)
+                    prefixes = target_prefixes.get(target_dir)
+                    if prefixes is None:
+                        prefixes = target_prefixes[target_dir] = _file_prefixes(
+                            target_dir
                         )
-                    new_file = os.path.join(media_root, media_name, new_name)
-                    if check_file(
-                        os.path.dirname(new_file), os.path.splitext(new_name)[0]
-                    ):
-                        if os.path.isfile(new_file) and os.path.samefile(
-                            orig_file, new_file
-                        ):
+                    replace = new_prefix in prefixes
+                    if replace:
+                        # Stat the source once per poster, the target once per folder
+                        if orig_stat is None:
+                            orig_stat = os.stat(orig_file)
+                        try:
+                            already_linked = os.path.samestat(
+                                orig_stat, os.stat(new_file)
+                            )
+                        except OSError:
+                            already_linked = False
+                        if already_linked:
                             continue
                         else:
                             if opts.all:
-                                prompt_msg = f"Replace all poster files in {os.path.dirname(new_file)}?"
+                                prompt_msg = (
+                                    f"Replace all poster files in {target_dir}?"
+                                )
                             else:
                                 prompt_msg = "Replace existing files?"
-                            if replace_files or typer.confirm(prompt_msg):
+                            if replace_files or confirm(prompt_msg, default=opts.all):
                                 replace_files = True
-                                delete_file(
-                                    os.path.dirname(new_file),
-                                    os.path.splitext(new_name)[0],
-                                    False,
-                                )
                             else:
                                 console.print(
-                                    f"[yellow]Skipping folder {os.path.dirname(new_file)}[/yellow]"
+                                    f"[yellow]Skipping folder {target_dir}[/yellow]"
                                 )
                                 continue
-                    os.link(orig_file, new_file)
+                    links.append((orig_file, new_file, replace))
+                    prefixes.add(new_prefix)
+
+    return links
+
+
+def link_posters(links):
+    """Creates planned poster hard links in parallel.
+
+    Links with the same target are created once, using the last planned
+    source, which matches replacing the poster in order. Links into the same
+    folder run in plan order within one task, so removing another extension
+    of a poster never races with linking it.
+
+    Args:
+        links (list): The (orig_file, new_file, replace) tuples from
+            `plan_poster_links`.
+    """
+    # Keep the last link planned for each target, in plan order
+    targets = {}
+    for link in reversed(links):
+        targets.setdefault(link[1], link)
+    links_by_dir = collections.defaultdict(list)
+    for link in reversed(targets.values()):
+        links_by_dir[os.path.dirname(link[1])].append(link)
+
+    # Prompts are done, so the folders can be linked concurrently
+    with ThreadPoolExecutor() as executor:
+        results = list(
+            executor.map(
+                lambda dir_links: [link_poster(*link) for link in dir_links],
+                links_by_dir.values(),
+            )
+        )
+    for dir_links, errors in zip(links_by_dir.values(), results):
+        for (_, new_file, _), error in zip(dir_links, errors):
+            if error:
+                console.print(
+                    f"[bold red]Could not link poster {new_file}: {error}[/bold red]"
+                )
 
 
 def organize_movie_collection_folder(folder_dir):
@@ -532,71 +889,56 @@ def organize_movie_collection_folder(folder_dir):
     """
     global poster_data
     unmatched_files = []
+    with os.scandir(folder_dir) as it:
+        files = [entry.name for entry in it if entry.is_file()]
+    # Try to match every poster file to a movie in the library before prompting
+    matches = [
+        match_media_folder(
+            file,
+            poster_data.media_names,
+            poster_data.media_processed_keys,
+            score_cutoff=60,
+        )
+        for file in files
+    ]
 
-    for file in os.listdir(folder_dir):
+    for file, matched_media in zip(files, matches):
         source_file = os.path.join(folder_dir, file)
-        if os.path.isfile(source_file):
-            # Try to match this poster file to a movie in the library
-            matched_media = process.extractOne(
-                file,
-                poster_data.media_folder_names.keys(),
-                scorer=fuzz.token_sort_ratio,
-                score_cutoff=60,
-                processor=utils.default_process,
+        file_stem = os.path.splitext(file)[0]
+        if matched_media:
+            user_in = prompt_poster_organization(
+                file, matched_media[0], matched_media[1]
             )
 
-            if matched_media:
-                user_in = prompt_poster_organization(
-                    file, matched_media[0], matched_media[1]
+            if user_in in ["y", "f"]:
+                # Determine folder name: use match name for 'y', original file name for 'f'
+                if user_in == "y":
+                    folder_name = matched_media[0]
+                else:  # user_in == 'f'
+                    folder_name = file_stem
+
+                # Create a subfolder for this movie within the collection folder
+                place_poster(source_file, os.path.join(folder_dir, folder_name))
+                console.print(
+                    f"[green]Organized {file} into {folder_name} folder[/green]"
                 )
-
-                if user_in in ["y", "f"]:
-                    # Determine folder name: use match name for 'y', original file name for 'f'
-                    if user_in == "y":
-                        folder_name = matched_media[0]
-                    else:  # user_in == 'f'
-                        folder_name = os.path.splitext(file)[0]
-
-                    # Create a subfolder for this movie within the collection folder
-                    movie_folder = os.path.join(folder_dir, folder_name)
-                    if os.path.isdir(movie_folder):
-                        shutil.rmtree(movie_folder)
-                    os.mkdir(movie_folder)
-
-                    file_extension = os.path.splitext(file)[1]
-                    destination_file = os.path.join(
-                        movie_folder, ("poster%s" % file_extension)
-                    )
-                    os.rename(source_file, destination_file)
-                    console.print(
-                        f"[green]Organized {file} into {folder_name} folder[/green]"
-                    )
-                else:
-                    console.print(f"[yellow]Skipped {file}[/yellow]")
-                    continue
             else:
-                # No match found - ask if user wants to force rename
-                console.print()
-                console.print(f"[yellow]No match found for:[/yellow] [dim]{file}[/dim]")
-                if typer.confirm("Force rename anyway?", default=False):
-                    folder_name = os.path.splitext(file)[0]
-
-                    # Create a subfolder within the collection folder
-                    movie_folder = os.path.join(folder_dir, folder_name)
-                    if os.path.isdir(movie_folder):
-                        shutil.rmtree(movie_folder)
-                    os.mkdir(movie_folder)
-
-                    file_extension = os.path.splitext(file)[1]
-                    destination_file = os.path.join(
-                        movie_folder, ("poster%s" % file_extension)
-                    )
-                    os.rename(source_file, destination_file)
-                    console.print(
-                        f"[green]Organized {file} into {folder_name} folder[/green]"
-                    )
-                else:
-                    unmatched_files.append(file)
+                console.print(f"[yellow]Skipped {file}[/yellow]")
+                continue
+        else:
+            # No match found - ask if user wants to force rename
+            console.print()
+            console.print(f"[yellow]No match found for:[/yellow] [dim]{file}[/dim]")
+            if confirm("Force rename anyway?", default=False):
+                folder_name = file_stem
+
+                # Create a subfolder within the collection folder
+                place_poster(source_file, os.path.join(folder_dir, folder_name))
+                console.print(
+                    f"[green]Organized {file} into {folder_name} folder[/green]"
+                )
+            else:
+                unmatched_files.append(file)
 
     if unmatched_files:
         console.print(f"\n[yellow]Unmatched files in {folder_dir}:[/yellow]")
@@ -607,35 +949,138 @@ def organize_movie_collection_folder(folder_dir):
         )
 
 
+def zip_has_season_posters(source_zip):
+    """Checks a zip's member names for TV season posters without extracting it.
+
+    Only names whose file stem ends in "Season <number>" count, so movie
+    titles such as "Open Season 2 (2008)" are not mistaken for season posters.
+
+    Args:
+        source_zip (str): The path to the zip file.
+
+    Returns:
+        bool: True if any member is named like a season poster. False if
+            none is or the zip cannot be read, in which case extraction
+            reports the error.
+    """
+    try:
+        with zipfile.ZipFile(source_zip, "r") as zip_ref:
+            return any(
+                _SEASON_SUFFIX_RE.search(os.path.splitext(os.path.basename(name))[0])
+                for name in zip_ref.namelist()
+            )
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+def extract_zip(source_zip, destination_dir, rename=None):
+    """Extracts the posters in a zip file into a clean destination directory.
+
+    Any existing destination directory is removed first. Only image members
+    are extracted, so macOS resource forks and bundled readme files never
+    reach the poster folder. Members are streamed to disk in 1 MiB blocks,
+    and a member whose path would land outside the destination directory
+    aborts the extraction.
+
+    Args:
+        source_zip (str): The path to the zip file.
+        destination_dir (str): The directory to extract into.
+        rename (callable | None): Maps a member's file name to the name it is
+            written as, so no rename pass is needed after extracting.
+
+    Returns:
+        Exception | None: The error raised while extracting, or None on success.
+    """
+    try:
+        with zipfile.ZipFile(source_zip, "r") as zip_ref:
+            if os.path.isdir(destination_dir):
+                shutil.rmtree(destination_dir)
+            os.makedirs(destination_dir)
+            root = os.path.realpath(destination_dir)
+            created_dirs = {root}
+            for info in zip_ref.infolist():
+                if (
+                    info.is_dir()
+                    or info.filename.startswith("__MACOSX/")
+                    or not info.filename.lower().endswith(_IMAGE_EXTENSIONS)
+                ):
+                    continue
+                member_path = info.filename
+                if rename:
+                    member_dir, member_name = os.path.split(member_path)
+                    member_path = os.path.join(member_dir, rename(member_name))
+                target = os.path.realpath(os.path.join(root, member_path))
+                if os.path.commonpath([root, target]) != root:
+                    raise ValueError(f"Unsafe path in zip: {info.filename}")
+                target_dir = os.path.dirname(target)
+                if target_dir not in created_dirs:
+                    os.makedirs(target_dir, exist_ok=True)
+                    created_dirs.add(target_dir)
+                with zip_ref.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
+    except Exception as e:
+        return e
+    return None
+
+
+def archive_zip(source_zip):
+    """Moves a processed zip file into the `Archives` folder of POSTER_DIR.
+
+    An archived zip with the same name is replaced. The move is a single
+    rename when the archive folder is on the same filesystem, and only falls
+    back to copying the file when it is not.
+
+    Args:
+        source_zip (str): The path to the zip file.
+    """
+    archive_dir = os.path.join(POSTER_DIR, "Archives")
+    archive_file = os.path.join(archive_dir, os.path.basename(source_zip))
+    os.makedirs(archive_dir, exist_ok=True)
+    try:
+        os.replace(source_zip, archive_file)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source_zip, archive_file)
+
+
 def process_zip_file(selected_library):
     """Processes zipped poster files.
 
     This function iterates through found zip files, matches them to media in the
-    Plex library, and then extracts them. After extraction, it calls the
-    appropriate organization function based on the library type (movie or show)
-    and the quality of the match. It also handles archiving the zip file after
+    Plex library, and asks which ones to extract. The approved zips are then
+    extracted in parallel. Show posters are written under their Plex names
+    while extracting, and movie posters are organized afterwards based on the
+    quality of the match. It also handles archiving the zip file after
     processing.
 
     Args:
         selected_library (LibraryData): The Plex library to process posters for.
     """
     global poster_data
-    for poster_zip in poster_data.poster_zip_files.keys():
-        source_zip = poster_data.poster_zip_files.get(poster_zip)
+    # Each planned entry is (source_zip, destination_dir, direct_match)
+    planned = []
+    destinations = set()
+    for poster_zip, source_zip in poster_data.poster_zip_files.items():
         if not source_zip:
             continue
+        zip_dir = os.path.dirname(source_zip)
+        zip_name = os.path.basename(source_zip)
         destination_dir = ""
         unzip = ""
+        direct_match = False
         if selected_library and selected_library.type == "show":
             best_match, best_score = find_best_media_match(
-                poster_zip, list(poster_data.media_folder_names.keys())
+                poster_zip,
+                poster_data.media_names,
+                poster_data.media_normalized_names,
             )
             if best_match:
-                destination_dir = os.path.join(os.path.dirname(source_zip), best_match)
+                destination_dir = os.path.join(zip_dir, best_match)
                 unzip = (
                     "y"
                     if prompt_match_confirmation(
-                        os.path.basename(source_zip), best_match, best_score, "show"
+                        zip_name, best_match, best_score, "show"
                     )
                     else "n"
                 )
@@ -643,118 +1088,194 @@ def process_zip_file(selected_library):
                 console.print("[yellow]No matching media found[/yellow]")
                 continue
         elif selected_library and selected_library.type == "movie":
+            if zip_has_season_posters(source_zip):
+                console.print(
+                    f"[yellow]{zip_name} looks like a TV show pack: it contains "
+                    f"season posters, but {selected_library.title} is a movie "
+                    "library[/yellow]"
+                )
+                if not confirm("Process it as a movie pack anyway?", default=False):
+                    console.print(f"[yellow]Skipped {zip_name}[/yellow]")
+                    continue
             best_match, best_score = find_best_media_match(
-                poster_zip, list(poster_data.media_folder_names.keys())
+                poster_zip,
+                poster_data.media_names,
+                poster_data.media_normalized_names,
             )
-            if (
-                best_match and best_score > 70
-            ):  # Only use direct match if score is high enough
-                destination_dir = os.path.join(os.path.dirname(source_zip), best_match)
+            direct_match = bool(best_match and best_score > 70)
+            if direct_match:  # Only use direct match if score is high enough
+                destination_dir = os.path.join(zip_dir, best_match)
                 unzip = (
                     "y"
                     if prompt_match_confirmation(
-                        os.path.basename(source_zip), best_match, best_score, "movie"
+                        zip_name, best_match, best_score, "movie"
                     )
                     else "n"
                 )
             else:
                 # For movie sets/collections, unzip with current name and organize individually
-                destination_dir = os.path.join(
-                    os.path.dirname(source_zip),
-                    os.path.splitext(os.path.basename(source_zip))[0],
-                )
+                destination_dir = os.path.join(zip_dir, os.path.splitext(zip_name)[0])
                 unzip = (
                     "y"
-                    if prompt_collection_organization(
-                        os.path.basename(source_zip), best_match, best_score
-                    )
+                    if prompt_collection_organization(zip_name, best_match, best_score)
                     else "n"
                 )
-        if unzip == "y":
-            with zipfile.ZipFile(source_zip, "r") as zip_ref:
-                try:
-                    if os.path.isdir(destination_dir):
-                        shutil.rmtree(destination_dir)
-                    zip_ref.extractall(destination_dir)
-                except Exception as e:
-                    console.print(
-                        f"[bold red]Something went wrong extracting the zip: {e}[/bold red]"
-                    )
-                else:
-                    if selected_library and selected_library.type == "show":
-                        organize_show_folder(destination_dir)
-                    elif selected_library and selected_library.type == "movie":
-                        # Check if this was a direct match or a collection
-                        best_match, best_score = find_best_media_match(
-                            poster_zip, list(poster_data.media_folder_names.keys())
-                        )
-                        if best_match and best_score > 70:
-                            # Direct match - use standard organization
-                            organize_movie_folder(destination_dir)
-                        else:
-                            # Collection/set - organize individual movies within the collection
-                            console.print(
-                                f"\n[cyan]Processing collection folder: {os.path.basename(destination_dir)}[/cyan]"
-                            )
-                            organize_movie_collection_folder(destination_dir)
-                    if typer.confirm("Move zip file to archive folder?", default=True):
-                        if os.path.isfile(
-                            os.path.join(
-                                POSTER_DIR, "Archives", os.path.basename(source_zip)
-                            )
-                        ):
-                            os.remove(
-                                os.path.join(
-                                    POSTER_DIR, "Archives", os.path.basename(source_zip)
-                                )
-                            )
-                        shutil.move(source_zip, os.path.join(POSTER_DIR, "Archives"))
-        else:
+        if unzip != "y":
             console.print("[yellow]Skipped files[/yellow]")
+        elif destination_dir in destinations:
+            console.print(
+                f"[yellow]Another zip is already being extracted to {destination_dir}, skipping {zip_name}[/yellow]"
+            )
+        else:
+            destinations.add(destination_dir)
+            planned.append((source_zip, destination_dir, direct_match))
+
+    # Show posters are written under their Plex names while extracting
+    rename = (
+        show_poster_name
+        if selected_library and selected_library.type == "show"
+        else None
+    )
+    # Extraction is I/O and zlib bound, both of which release the GIL
+    with ThreadPoolExecutor() as executor:
+        errors = list(
+            executor.map(
+                extract_zip,
+                [source_zip for source_zip, _, _ in planned],
+                [destination_dir for _, destination_dir, _ in planned],
+                itertools.repeat(rename),
+            )
+        )
 
+    for (source_zip, destination_dir, direct_match), error in zip(planned, errors):
+        if error:
+            console.print(
+                f"[bold red]Something went wrong extracting the zip: {error}[/bold red]"
+            )
+            continue
+        if selected_library and selected_library.type == "movie":
+            if direct_match:
+                # Direct match - use standard organization
+                organize_movie_folder(destination_dir)
+            else:
+                # Collection/set - organize individual movies within the collection
+                console.print(
+                    f"\n[cyan]Processing collection folder: {os.path.basename(destination_dir)}[/cyan]"
+                )
+                organize_movie_collection_folder(destination_dir)
+        if confirm("Move zip file to archive folder?", default=True):
+            archive_zip(source_zip)
 
-def sync_movie_folder(path):
-    """Synchronizes a movie folder by matching it to the media library.
 
-    This function is used to process folders that may be unlinked or incorrectly
-    named. It attempts to find a match in the Plex library and, if successful,
-    renames the folder to match the media. This is particularly useful for the
-    '--unlinked' option.
+def _has_multiple_entries(path):
+    """Checks whether a directory holds more than one entry.
+
+    Stops reading the directory as soon as a second entry is found.
 
     Args:
-        path (str): The path to the movie folder to sync.
+        path (str): The directory to check.
+
+    Returns:
+        bool: True if the directory contains two or more entries.
+    """
+    with os.scandir(path) as it:
+        return next(it, None) is not None and next(it, None) is not None
+
+
+def batch_sync_movie_folders(paths):
+    """Synchronizes several movie folders against the media library in one pass.
+
+    This is used for the '--unlinked' option, to fix folders that are not
+    named after their media. All single-poster folders are matched first,
+    against the media name keys cached on `poster_data`, and the user is then
+    prompted to rename each folder to its match. Folders holding more than one
+    entry are organized with `organize_movie_folder` instead.
+
+    Args:
+        paths (Iterable[str]): The paths to the movie folders to sync.
     """
     global poster_data
-    if len(os.listdir(path)) > 1:
-        console.print(f"[cyan]Organizing complex folder: {path}[/cyan]")
-        organize_movie_folder(path)
+    matches = []
+    # Folders whose names sort to the same tokens share a single match
+    matches_by_key = {}
+    for path in paths:
+        if _has_multiple_entries(path):
+            console.print(f"[cyan]Organizing complex folder: {path}[/cyan]")
+            organize_movie_folder(path)
+            continue
+        key = sort_tokens(os.path.basename(path))
+        if key not in matches_by_key:
+            matches_by_key[key] = match_media_folder(
+                key,
+                poster_data.media_names,
+                poster_data.media_sort_keys,
+                score_cutoff=70,
+                processor=None,
+            )
+        matches.append((path, matches_by_key[key]))
+
+    for path, matched_media in matches:
+        rename_matched_folder(path, matched_media)
+
+
+def rename_matched_folder(path, matched_media):
+    """Renames a poster folder to its matched media name after confirmation.
+
+    Args:
+        path (str): The path to the poster folder.
+        matched_media (tuple | None): The matched media name and score for the
+            folder, or None if no match was found.
+    """
+    if matched_media:
+        if prompt_match_confirmation(
+            os.path.basename(path), matched_media[0], matched_media[1], "folder"
+        ):
+            new_path = os.path.join(os.path.dirname(path), matched_media[0])
+            # os.rename silently replaces an empty directory, so check first
+            if os.path.lexists(new_path):
+                console.print(
+                    f"[bold red]Error: Target directory {new_path} already exists. Skipping rename.[/bold red]"
+                )
+            else:
+                os.rename(path, new_path)
+                console.print(
+                    f"[green]Renamed {os.path.basename(path)} to {matched_media[0]}[/green]"
+                )
     else:
-        matched_media = process.extractOne(
-            path,
-            list(poster_data.media_folder_names.keys()),
-            scorer=fuzz.token_sort_ratio,
-            processor=lambda x: os.path.basename(x),
-            score_cutoff=70,
-        )
+        console.print(f"[yellow]No match found for {os.path.basename(path)}[/yellow]")
 
-        if matched_media:
-            if prompt_match_confirmation(
-                os.path.basename(path), matched_media[0], matched_media[1], "folder"
-            ):
-                new_path = os.path.join(os.path.dirname(path), matched_media[0])
-                if os.path.isdir(new_path):
-                    console.print(
-                        f"[bold red]Error: Target directory {new_path} already exists. Skipping rename.[/bold red]"
-                    )
-                else:
-                    os.rename(path, new_path)
-                    console.print(
-                        f"[green]Renamed {os.path.basename(path)} to {matched_media[0]}[/green]"
-                    )
-        else:
-            console.print(
-                f"[yellow]No match found for {os.path.basename(path)}[/yellow]"
-            )
+
+def has_file(directory):
+    """Checks if a directory contains at least one file.
+
+    Stops at the first file found.
+
+    Args:
+        directory (str): The directory to search in.
+
+    Returns:
+        bool: True if the directory holds a file, False otherwise.
+    """
+    with os.scandir(directory) as entries:
+        return any(entry.is_file() for entry in entries)
+
+
+def _has_stem(file_name, prefix):
+    """Checks if a file name is a prefix followed by at most one extension.
+
+    Equivalent to ``os.path.splitext(file_name)[0] == prefix`` for the
+    non-empty prefixes used here, without building the split tuple.
+
+    Args:
+        file_name (str): The file name to check.
+        prefix (str): The file name without extension to compare against.
+
+    Returns:
+        bool: True if the file name has the given stem, False otherwise.
+    """
+    return file_name == prefix or (
+        file_name.startswith(prefix) and file_name.rfind(".") == len(prefix)
+    )
 
 
 def check_file(directory, prefix):
@@ -767,24 +1288,52 @@ def check_file(directory, prefix):
     Returns:
         bool: True if a file with the prefix exists, False otherwise.
     """
-    for s in os.listdir(directory):
-        if os.path.splitext(s)[0] == prefix and os.path.isfile(
-            os.path.join(directory, s)
-        ):
-            return True
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if _has_stem(entry.name, prefix) and entry.is_file():
+                return True
     return False
 
 
-def delete_file(directory, prefix, prompt: Boolean):
+def _file_prefixes(directory):
+    """Lists the names (without extension) of all files in a directory.
+
+    Args:
+        directory (str): The directory to scan.
+
+    Returns:
+        set: File names in the directory with their extensions removed.
+    """
+    with os.scandir(directory) as entries:
+        return {os.path.splitext(e.name)[0] for e in entries if e.is_file()}
+
+
+def matching_files(directory, prefix, keep: str | None = None):
+    """Lists the files in a directory with a specific prefix in one scan.
+
+    Args:
+        directory (str): The directory to search in.
+        prefix (str): The prefix of the files to find (without extension).
+        keep (str | None): A file name to leave out even if it matches.
+
+    Returns:
+        list: Full paths of the matching files.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.name != keep and _has_stem(entry.name, prefix) and entry.is_file()
+        ]
+
+
+def delete_file(directory, prefix, keep: str | None = None):
     """Deletes files in a directory with a specific prefix.
 
     Args:
         directory (str): The directory to delete files from.
         prefix (str): The prefix of the files to delete (without extension).
-        prompt (bool): If True, ask for user confirmation before deleting.
+        keep (str | None): A file name to leave in place even if it matches.
     """
-    for s in os.listdir(directory):
-        file_path = os.path.join(directory, s)
-        if os.path.splitext(s)[0] == prefix and os.path.isfile(file_path):
-            if not prompt or typer.confirm(f"Delete {file_path}?"):
-                os.remove(file_path)
+    for file_path in matching_files(directory, prefix, keep):
+        os.remove(file_path)
@@ -6,19 +6,28 @@ files using fuzzy string matching. It is decoupled from CLI/UI presentation
 layers to improve testability and maintainability.
 """
 
+import functools
 import os
 import re
 import string
+import sys
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+# Matches a "(year)" anywhere, or a trailing "set by ..." credit
+_STRIP_RE = re.compile(r"\(\d{4}\)|\s+set by.*$", re.IGNORECASE)
 
+
+@functools.lru_cache(maxsize=8192)
 def normalize_name(name: str) -> str:
     """Normalizes a name for better fuzzy string matching.
 
     This function removes the file extension, year, 'set by' text, and all
     punctuation from a given string and converts it to lowercase. This helps
-    in comparing poster names with media folder names more accurately.
+    in comparing poster names with media folder names more accurately. The
+    result is interned and memoized, since the same library names are
+    normalized and compared for every poster.
 
     Args:
         name (str): The name to normalize.
@@ -26,34 +35,61 @@ def normalize_name(name: str) -> str:
     Returns:
         str: The normalized name.
     """
-    name = os.path.splitext(name)[0]
-    name = re.sub(r"\(\d{4}\)", "", name)  # remove (year)
-    name = re.sub(r"\s+set by.*$", "", name, flags=re.IGNORECASE).strip()
-    name = name.translate(str.maketrans("", "", string.punctuation)).lower()
-    return name
+    name = _STRIP_RE.sub("", os.path.splitext(name)[0]).strip()
+    return sys.intern(name.translate(_PUNCT_TABLE).lower())
+
+
+def sort_tokens(name: str) -> str:
+    """Sorts the whitespace-separated tokens of a name.
+
+    Comparing two sorted-token strings with `fuzz.ratio` (a bit-parallel Indel
+    similarity) gives the same score as `fuzz.token_sort_ratio` on the original
+    strings. Sorting a candidate list once up front therefore avoids
+    re-tokenizing and re-sorting every candidate on every comparison.
+
+    Args:
+        name (str): The name to sort, already processed as needed.
+
+    Returns:
+        str: The tokens of the name, sorted and joined by single spaces.
+    """
+    return " ".join(sorted(name.split()))
 
 
-def find_best_media_match(poster_zip_name: str, media_names: list):
+def find_best_media_match(
+    poster_zip_name: str, media_names: list, normalized_names: list | None = None
+):
     """Finds the best media match for a poster zip file.
 
     This function uses fuzzy string matching to find the best match between a
     poster zip file name and a list of media folder names. It normalizes both
-    names before comparing them.
+    names before comparing them. An exact normalized match is returned with a
+    score of 100, otherwise all candidates are scored in a single
+    `process.extractOne` call.
 
     Args:
         poster_zip_name (str): The name of the poster zip file.
         media_names (list): A list of media folder names to compare against.
+            Must support indexing (e.g. a list, not a dict keys view).
+        normalized_names (list, optional): `normalize_name` applied to each entry
+            of `media_names`, in the same order. Pass this when matching many
+            zips against the same library to skip re-normalizing the candidates.
 
     Returns:
         tuple: A tuple containing the best match and the matching score.
     """
-    best_match = None
-    best_score = 0
     norm_poster = normalize_name(poster_zip_name)
-    for candidate in media_names:
-        norm_candidate = normalize_name(candidate)
-        # Use token_set_ratio as a good replacement for partial_token_sort_ratio
-        score = fuzz.token_set_ratio(norm_poster, norm_candidate)
-        if score > best_score:
-            best_match, best_score = candidate, score
-    return best_match, best_score
+    if normalized_names is None:
+        normalized_names = [normalize_name(candidate) for candidate in media_names]
+    # An exact normalized match needs no fuzzy scoring. Names are interned, so
+    # list.index mostly compares by identity.
+    if norm_poster and norm_poster in normalized_names:
+        return media_names[normalized_names.index(norm_poster)], 100
+    # Use token_set_ratio as a good replacement for partial_token_sort_ratio
+    result = process.extractOne(
+        norm_poster, normalized_names, scorer=fuzz.token_set_ratio
+    )
+    if not result or not result[1]:
+        return None, 0
+    _, best_score, index = result
+    return media_names[index], best_score
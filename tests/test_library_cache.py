@@ -0,0 +1,114 @@
+"""Tests for library_cache.py"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from tpdb.library_cache import LibraryCache
+
+SERVER_URL = "http://localhost:32400"
+LIBRARIES = [
+    {"title": "Movies", "type": "movie", "locations": ["/media/movies"]},
+    {"title": "TV Shows", "type": "show", "locations": ["/media/tv", "/media/tv2"]},
+]
+
+
+class TestLibraryCache:
+    """Tests for LibraryCache."""
+
+    @pytest.fixture
+    def temp_cache_path(self, tmp_path):
+        """Create a temporary cache path for testing."""
+        return tmp_path / "cache" / "libraries.json"
+
+    @pytest.fixture
+    def cache(self, temp_cache_path):
+        """Create a LibraryCache with temp path."""
+        return LibraryCache(cache_path=temp_cache_path)
+
+    def test_default_cache_path(self):
+        """Test that default cache path is set correctly."""
+        cache = LibraryCache()
+        assert cache.cache_path == Path.home() / ".cache" / "tpdb" / "libraries.json"
+
+    def test_load_nonexistent_cache(self, cache):
+        """Test loading when cache file doesn't exist."""
+        assert cache.load(SERVER_URL) is None
+
+    def test_save_and_load_libraries(self, cache):
+        """Test saving and loading libraries, creating parent directories."""
+        cache.save(SERVER_URL, LIBRARIES)
+
+        assert cache.cache_path.exists()
+        assert cache.load(SERVER_URL) == LIBRARIES
+
+    def test_load_other_server(self, cache):
+        """Test that entries are keyed by server URL."""
+        cache.save(SERVER_URL, LIBRARIES)
+
+        assert cache.load("http://other:32400") is None
+
+    def test_save_keeps_other_servers(self, cache):
+        """Test that saving one server keeps the entries of another."""
+        other = [{"title": "Anime", "type": "show", "locations": ["/media/anime"]}]
+        cache.save(SERVER_URL, LIBRARIES)
+        cache.save("http://other:32400", other)
+
+        assert cache.load(SERVER_URL) == LIBRARIES
+        assert cache.load("http://other:32400") == other
+
+    def test_load_expired_entry(self, temp_cache_path):
+        """Test that entries older than the TTL are ignored."""
+        cache = LibraryCache(cache_path=temp_cache_path, ttl=0)
+        cache.save(SERVER_URL, LIBRARIES)
+
+        assert cache.load(SERVER_URL) is None
+
+    def test_load_invalid_json(self, cache, temp_cache_path):
+        """Test loading a corrupt cache file."""
+        temp_cache_path.parent.mkdir(parents=True)
+        temp_cache_path.write_text("{not json")
+
+        assert cache.load(SERVER_URL) is None
+
+    @pytest.mark.parametrize(
+        "libraries",
+        [
+            "x",
+            ["Movies"],
+            [{"title": "Movies", "type": "movie"}],
+            [{"title": "Movies", "locations": ["/media/movies"]}],
+            [{"type": "movie", "locations": ["/media/movies"]}],
+            [{"title": "Movies", "type": "movie", "locations": "/media/movies"}],
+            [LIBRARIES[0], None],
+        ],
+    )
+    def test_load_malformed_entry(self, cache, temp_cache_path, libraries):
+        """Test loading an entry without the expected fields."""
+        temp_cache_path.parent.mkdir(parents=True)
+        temp_cache_path.write_text(
+            json.dumps({SERVER_URL: {"saved_at": time.time(), "libraries": libraries}})
+        )
+
+        assert cache.load(SERVER_URL) is None
+
+    def test_save_overwrites_corrupt_cache(self, cache, temp_cache_path):
+        """Test that saving replaces a corrupt cache file."""
+        temp_cache_path.parent.mkdir(parents=True)
+        temp_cache_path.write_text("{not json")
+
+        cache.save(SERVER_URL, LIBRARIES)
+
+        assert cache.load(SERVER_URL) == LIBRARIES
+        assert not temp_cache_path.with_name("libraries.json.tmp").exists()
+
+    def test_save_error(self, tmp_path):
+        """Test that a write failure raises IOError."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        cache = LibraryCache(cache_path=blocker / "libraries.json")
+
+        with pytest.raises(IOError):
+            cache.save(SERVER_URL, LIBRARIES)
@@ -0,0 +1,143 @@
+"""Tests for the file helpers in the main module.
+
+This module tests the poster file helpers against temporary directories.
+"""
+
+import os
+import zipfile
+
+import pytest
+
+import tpdb.main
+from tpdb.main import Options, _has_stem, confirm, extract_zip, prompt_file_selection
+
+
+# Tests for extract_zip function
+@pytest.fixture
+def make_zip(tmp_path):
+    """Create a zip file in the temp directory from a name to content mapping."""
+
+    def _make_zip(members):
+        zip_path = tmp_path / "pack.zip"
+        with zipfile.ZipFile(zip_path, "w") as zip_ref:
+            for name, content in members.items():
+                zip_ref.writestr(name, content)
+        return zip_path
+
+    return _make_zip
+
+
+def test_extract_zip_skips_non_image_members(make_zip, tmp_path):
+    """Test that only image members are extracted."""
+    source_zip = make_zip(
+        {
+            "Movie (2020).jpg": "poster",
+            "Movie (2020) - Back.PNG": "poster",
+            "readme.txt": "text",
+            "__MACOSX/._Movie (2020).jpg": "fork",
+        }
+    )
+    destination = tmp_path / "out"
+
+    assert extract_zip(str(source_zip), str(destination)) is None
+    assert sorted(p.name for p in destination.rglob("*")) == [
+        "Movie (2020) - Back.PNG",
+        "Movie (2020).jpg",
+    ]
+
+
+def test_extract_zip_replaces_existing_destination(make_zip, tmp_path):
+    """Test that an existing destination is cleared before extracting."""
+    source_zip = make_zip({"Movie (2020).jpg": "poster"})
+    destination = tmp_path / "out"
+    destination.mkdir()
+    (destination / "old.jpg").write_text("old")
+
+    assert extract_zip(str(source_zip), str(destination)) is None
+    assert [p.name for p in destination.iterdir()] == ["Movie (2020).jpg"]
+
+
+@pytest.mark.parametrize("member", ["../evil.jpg", "nested/../../evil.jpg"])
+def test_extract_zip_rejects_path_traversal(make_zip, tmp_path, member):
+    """Test that a member escaping the destination aborts the extraction."""
+    source_zip = make_zip({member: "evil"})
+    destination = tmp_path / "out"
+
+    error = extract_zip(str(source_zip), str(destination))
+
+    assert isinstance(error, ValueError)
+    assert not (tmp_path / "evil.jpg").exists()
+
+
+def test_extract_zip_renames_members(make_zip, tmp_path):
+    """Test that members are written under the names from `rename`."""
+    source_zip = make_zip({"Show - Season 1.jpg": "poster"})
+    destination = tmp_path / "out"
+
+    assert extract_zip(str(source_zip), str(destination), str.lower) is None
+    assert [p.name for p in destination.iterdir()] == ["show - season 1.jpg"]
+
+
+def test_extract_zip_bad_file(tmp_path):
+    """Test that a file that is not a zip returns the error."""
+    source_zip = tmp_path / "pack.zip"
+    source_zip.write_text("not a zip")
+
+    assert isinstance(
+        extract_zip(str(source_zip), str(tmp_path / "out")), zipfile.BadZipFile
+    )
+
+
+# Tests for _has_stem function
+@pytest.mark.parametrize(
+    "file_name,prefix",
+    [
+        ("poster.jpg", "poster"),
+        ("poster", "poster"),
+        ("poster.", "poster"),
+        ("posters.jpg", "poster"),
+        ("poster.jpg.bak", "poster"),
+        ("poster.jpg.bak", "poster.jpg"),
+        ("Movie (2020).final.jpg", "Movie (2020)"),
+        ("Movie (2020).final.jpg", "Movie (2020).final"),
+        ("a.b.jpg", "a.b"),
+        ("a.b.jpg", "a"),
+        (".poster", "poster"),
+        (".poster.jpg", ".poster"),
+        ("season-specials-poster.png", "season-specials-poster"),
+    ],
+)
+def test_has_stem_matches_splitext(file_name, prefix):
+    """Test that _has_stem agrees with comparing the splitext stem."""
+    assert _has_stem(file_name, prefix) == (os.path.splitext(file_name)[0] == prefix)
+
+
+# Tests for confirm function
+@pytest.fixture
+def yes_mode(monkeypatch):
+    """Run with the --yes option set."""
+    opts = Options()
+    opts.yes = True
+    monkeypatch.setattr(tpdb.main, "opts", opts)
+
+
+@pytest.mark.parametrize("default", [True, False])
+def test_confirm_yes_mode_uses_default(yes_mode, capsys, default):
+    """Test that --yes answers with the default, even for bracketed messages."""
+    message = "Hardlink posters from [/data/Posters/Alien]?"
+
+    assert confirm(message, default=default) is default
+    assert "[/data/Posters/Alien]" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("default", [True, False])
+def test_confirm_yes_mode_prefers_yes_answer(yes_mode, default):
+    """Test that --yes answers with yes_answer when it is given."""
+    assert confirm("Process folder?", default=default, yes_answer=True) is True
+    assert confirm("Process folder?", default=default, yes_answer=False) is False
+
+
+# Tests for prompt_file_selection function
+def test_prompt_file_selection_yes_mode_selects_nothing(yes_mode):
+    """Test that --yes selects no files, like the empty default answer."""
+    assert prompt_file_selection("Posters", ["poster.jpg", "poster.png"]) == []
@@ -5,7 +5,9 @@ This module tests the fuzzy matching and name processing utilities.
 
 import pytest
 
-from tpdb.matcher import find_best_media_match, normalize_name
+from rapidfuzz import fuzz
+
+from tpdb.matcher import find_best_media_match, normalize_name, sort_tokens
 
 
 # Tests for normalize_name function
@@ -151,3 +153,91 @@ def test_find_best_media_match_single_item():
     match, score = find_best_media_match("The Dark Knight", ["The Dark Knight"])
     assert match == "The Dark Knight"
     assert score >= 90
+
+
+def test_find_best_media_match_returns_first_of_equal_scores():
+    """Test find_best_media_match keeps the first candidate on a score tie."""
+    match, score = find_best_media_match(
+        "The Dark Knight", ["The Dark Knight (2008)", "The Dark Knight"]
+    )
+    assert match == "The Dark Knight (2008)"
+    assert score == 100
+
+
+# Tests for sort_tokens function
+@pytest.mark.parametrize(
+    "input_name,expected",
+    [
+        ("the dark knight", "dark knight the"),
+        ("knight  dark   the", "dark knight the"),
+        ("movie", "movie"),
+        ("", ""),
+    ],
+)
+def test_sort_tokens(input_name, expected):
+    """Test sort_tokens with various inputs."""
+    assert sort_tokens(input_name) == expected
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        ("the dark knight", "knight dark the"),
+        ("avengers endgame", "avengers infinity war"),
+        ("star wars collection", "star wars episode iv"),
+    ],
+)
+def test_sort_tokens_ratio_matches_token_sort_ratio(first, second):
+    """Test that ratio on sorted tokens equals token_sort_ratio."""
+    assert fuzz.ratio(sort_tokens(first), sort_tokens(second)) == pytest.approx(
+        fuzz.token_sort_ratio(first, second)
+    )
+
+
+def test_find_best_media_match_ignores_length_difference_for_subsets():
+    """Test that a title contained in a much longer name still scores 100.
+
+    token_set_ratio is not bounded by the length ratio of the two names, so
+    candidates must not be pruned by length before scoring.
+    """
+    match, score = find_best_media_match(
+        "Alien", ["Aliens", "Alien The Directors Cut Remastered Special Edition"]
+    )
+    assert match == "Alien The Directors Cut Remastered Special Edition"
+    assert score == 100
+
+
+def test_normalize_name_returns_interned_string():
+    """Test that equal normalized names share a single string object."""
+    first = normalize_name("The Movie (2022).jpg")
+    second = normalize_name("The Movie! (2022).png")
+    assert first == second
+    assert first is second
+
+
+def test_normalize_name_is_memoized():
+    """Test that repeated names are served from the normalize_name cache."""
+    normalize_name.cache_clear()
+    normalize_name("The Dark Knight (2008)")
+    normalize_name("The Dark Knight (2008)")
+    info = normalize_name.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_find_best_media_match_with_prenormalized_names():
+    """Test that pre-normalized candidates give the same result."""
+    media_names = ["The Dark Knight (2008)", "Inception (2010)", "Interstellar (2014)"]
+    normalized = [normalize_name(name) for name in media_names]
+    assert find_best_media_match(
+        "Inception (2010) set by Someone", media_names, normalized
+    ) == find_best_media_match("Inception (2010) set by Someone", media_names)
+
+
+def test_find_best_media_match_prefers_exact_normalized_match():
+    """Test that an exact normalized name wins over an earlier subset match."""
+    match, score = find_best_media_match(
+        "Alien (1979)", ["Alien The Directors Cut Remastered Special Edition", "Alien"]
+    )
+    assert match == "Alien"
+    assert score == 100